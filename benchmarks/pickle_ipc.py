@@ -0,0 +1,71 @@
+"""Benchmark pickle size and process pool IPC for batches of addresses.
+
+Compares the class reference and int pickles of hwaddress objects with the
+previous default, the class reference plus the instance __dict__ holding
+the digit tuple.
+
+Run with: python benchmarks/pickle_ipc.py
+"""
+
+import copyreg
+import pickle
+import time
+from multiprocessing import Pool
+
+from hwaddress import EUI_48
+
+N = 200_000
+CHUNK = 10_000
+
+
+class Legacy:
+    """Pickle an address the way it was pickled before __reduce__ was added."""
+
+    def __init__(self, address):
+        """Wrap address."""
+        self.address = address
+
+    def __reduce__(self):
+        """Pickle as class reference and instance __dict__ with the digit tuple."""
+        address = self.address
+        args = (type(address), object, None)
+        return (copyreg._reconstructor, args, {"_digits_": address._digits_})
+
+
+def count(batch):
+    """Worker receiving a batch of addresses."""
+    return len(batch)
+
+
+def timeit(func, *args, repeat=3):
+    """Return the best time of repeat calls to func."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run benchmark and print results."""
+    addresses = EUI_48.random(N, seed=0)
+    payloads = {
+        "legacy (class, __dict__)": [Legacy(a) for a in addresses],
+        "__reduce__ (class, int)": addresses,
+    }
+
+    print(f"{N} EUI_48 addresses, process pool chunks of {CHUNK}")
+    print(f"{'payload':<26}{'bytes':>12}{'dumps+loads s':>16}{'pool map s':>12}")
+
+    with Pool(2) as pool:
+        for name, payload in payloads.items():
+            size = len(pickle.dumps(payload, pickle.HIGHEST_PROTOCOL))
+            serial = timeit(lambda: pickle.loads(pickle.dumps(payload, pickle.HIGHEST_PROTOCOL)))
+            chunks = [payload[i : i + CHUNK] for i in range(0, N, CHUNK)]
+            ipc = timeit(pool.map, count, chunks)
+            print(f"{name:<26}{size:>12}{serial:>16.3f}{ipc:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from hwaddress.core import (
     MAC,
     MAC_64,
     GUID,
+    OUI,
     EUI_48,
     EUI_64,
     WWN,
@@ -15,3 +16,4 @@ from hwaddress.core import (
     IB_GUID,
     IB_GID,
 )
+from hwaddress.diff import DiffEvent, SnapshotDiff
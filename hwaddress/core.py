@@ -1,5 +1,149 @@
 """Lightweight EUI-48, EUI-64 based hardware (MAC) address library."""
 
+import sys
+from pickle import PicklingError
+from random import Random
+
+_BIN_DIGITS_ = {d: format(int(d, 16), "04b") for d in "0123456789abcdef"}
+
+_EUI_FFFE_ = 0xFFFE
+_EUI_UL_BIT_ = 1 << 57  # universal/local bit of a 64 bit address
+
+
+def _join_digits_(digits, delimiter, group, upper):
+    """Join hex digits into a string based on delimiter, group, and upper."""
+    if isinstance(group, int):
+        parts = ["".join(digits[i : i + group]) for i in range(0, len(digits), group)]
+    elif isinstance(group, tuple):
+        parts = []
+        s = 0
+        for i in group:
+            parts.append("".join(digits[s : s + i]))
+            s += i
+
+    string = delimiter.join(parts)
+
+    if upper:
+        string = string.upper()
+
+    if delimiter == "":
+        return f"0x{string}"
+
+    return string
+
+
+# classes created by _class_from_key_, keyed by _class_key_
+_registry_ = {}
+
+
+def _class_key_(cls):
+    """Return the attributes that define the format of a hwaddress class."""
+    return (cls.__name__, cls._len_, cls._grp_, cls._del_, cls._upper_)
+
+
+def _class_from_key_(name, length=48, grouping=2, delimiter=":", upper=False):
+    """Return registered class for key, creating a subclass of MAC if needed."""
+    key = (name, length, grouping, delimiter, upper)
+
+    try:
+        return _registry_[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # unhashable attributes, class will fail on instantiation
+        key = None
+
+    # _by_key_ marks the class itself, subclasses of it are not pickled by key
+    prop = dict(_len_=length, _del_=delimiter, _grp_=grouping, _upper_=upper, _by_key_=True)
+    obj = type(name, (MAC,), prop)
+
+    if key is not None:
+        _registry_[key] = obj
+
+    return obj
+
+
+def _class_by_name_(module, qualname):
+    """Return object by module and qualified name if module is imported, else None."""
+    obj = sys.modules.get(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name, None)
+    return obj
+
+
+def _class_ref_(cls):
+    """Return reference used to pickle hwaddress class.
+
+    Classes that can be imported by module and qualified name are their own
+    reference. Classes returned by new_hwaddress_class are referenced by
+    class key, which recreates an equal class if it is not registered.
+
+    Raises:
+        PicklingError: If cls can not be imported and was not created
+            by new_hwaddress_class.
+    """
+    ref = cls.__dict__.get("_ref_")
+
+    if ref is None:
+        if _class_by_name_(cls.__module__, cls.__qualname__) is cls:
+            ref = cls
+        elif cls.__dict__.get("_by_key_"):
+            ref = _class_key_(cls)
+        else:
+            raise PicklingError(
+                f"Can't pickle {cls.__qualname__}: it can not be imported "
+                "and was not created by new_hwaddress_class."
+            )
+
+        cls._ref_ = ref
+
+    return ref
+
+
+def _class_from_ref_(ref):
+    """Return hwaddress class for reference created by _class_ref_."""
+    if isinstance(ref, tuple):
+        return _class_from_key_(*ref)
+    return ref
+
+
+def _unpickle_(ref, value):
+    """Recreate pickled hwaddress object from class reference and int."""
+    return _class_from_ref_(ref)._from_int_(value)
+
+
+def _check_format_(delimiter, group, upper):
+    """Raise AttributeError if formatting options do not conform to restraints."""
+    if not isinstance(delimiter, str):
+        raise AttributeError("delimiter must be a string")
+
+    # check that group is an int or tuple
+    if not isinstance(group, (int, tuple)):
+        raise AttributeError("group must be an int or tuple.")
+
+    # check that upper is True or False
+    if not isinstance(upper, bool):
+        raise AttributeError("upper must be True or False")
+
+
+def _oui_int_(oui):
+    """Return int value of OUI object, string or 24 bit int."""
+    if isinstance(oui, str):
+        return OUI(oui).int
+
+    if isinstance(oui, MAC):
+        if oui._len_ != 24:
+            raise TypeError(f"oui must be 24 bits, got '{oui.__class__.__name__}'.")
+        return oui.int
+
+    if (not isinstance(oui, int)) or isinstance(oui, bool):
+        raise TypeError("oui must be 'OUI', string or int.")
+
+    if not 0 <= oui < 1 << 24:
+        raise ValueError(f"oui {oui} does not fit in 24 bits.")
+
+    return oui
+
 
 class MAC:
     """Generic 48 bit MAC address object.
@@ -13,6 +157,7 @@ class MAC:
     _grp_ = 2  # default group size of hex digits, (1, 2, 3, 4)
     _del_ = ":"  # default delimiter, ("-", ":", ".", " ", "")
     _upper_ = False
+    _lead_ = None  # allowed first hex digits of generated addresses, None for any
 
     def __init__(self, address):
         """Initialize address object.
@@ -34,17 +179,7 @@ class MAC:
         if (not isinstance(self._len_, int)) or (self._len_ % 4 != 0):
             raise AttributeError("length must be an int divisible by 4")
 
-        if not isinstance(self._del_, str):
-            raise AttributeError("delimiter must be a string")
-
-        # check that self._grp_ is an int or tuple
-        if not isinstance(self._grp_, (int, tuple)):
-            raise AttributeError("group must be an int or tuple.")
-
-        # check that self._upper_ is True or False
-        # if self._upper_ not in (True, False):
-        if not isinstance(self._upper_, bool):
-            raise AttributeError("upper must be True or False")
+        _check_format_(self._del_, self._grp_, self._upper_)
 
         if isinstance(address, str):
             self._proc_string_(address)
@@ -65,12 +200,74 @@ class MAC:
             raise ValueError
 
         try:
-            int(hws, 16)
+            self._int_ = int(hws, 16)
         except ValueError:
             raise ValueError(f"'{string}' contains non hexadecimal digits.")
 
         self._digits_ = tuple(hws)
 
+    @classmethod
+    def _from_int_(cls, value):
+        """Create instance directly from int without parsing a string."""
+        return cls._from_ints_((value,))[0]
+
+    @classmethod
+    def _from_ints_(cls, values):
+        """Return list of instances created directly from ints.
+
+        Raises:
+            ValueError: If a value does not fit in cls._len_ bits
+                or does not meet the class restrictions.
+        """
+        new = cls.__new__
+        spec = f"0{cls._len_ // 4}x"
+        maxint = 1 << cls._len_
+
+        result = []
+        for value in values:
+            if not 0 <= value < maxint:
+                raise ValueError(f"{value} does not fit in {cls._len_} bits.")
+
+            obj = new(cls)
+            obj._int_ = value
+            obj._digits_ = tuple(format(value, spec))
+            obj._restrict_()
+            result.append(obj)
+
+        return result
+
+    @classmethod
+    def _int_for_(cls, address):
+        """Return int value of instance of cls or int that fits in cls._len_ bits."""
+        if isinstance(address, cls) and address._len_ == cls._len_:
+            return address._int_
+
+        if (not isinstance(address, int)) or isinstance(address, bool):
+            raise TypeError(f"address must be '{cls.__name__}' or int.")
+
+        if not 0 <= address < 1 << cls._len_:
+            raise ValueError(f"{address} does not fit in {cls._len_} bits.")
+
+        return address
+
+    @classmethod
+    def _address_int_(cls, address):
+        """Return int value of address object, string or int.
+
+        Strings are parsed as cls and hwaddress objects of the same length
+        as cls are taken by int.
+        """
+        if isinstance(address, str):
+            return cls(address).int
+        if isinstance(address, MAC) and address._len_ == cls._len_:
+            return address.int
+        return cls._int_for_(address)
+
+    @classmethod
+    def _ints_for_(cls, addresses):
+        """Return set of int values of address objects, strings or ints."""
+        return {cls._address_int_(address) for address in addresses}
+
     def _restrict_(self):
         """Raise error if restrictions are not met."""
         pass
@@ -97,7 +294,11 @@ class MAC:
 
     def __hash__(self):
         """Make hashable."""
-        return hash(f"{self.__class__}{self._digits_}")
+        return hash((self.__class__, self._int_))
+
+    def __reduce__(self):
+        """Pickle as class reference and int."""
+        return (_unpickle_, (_class_ref_(self.__class__), self._int_))
 
     def __repr__(self):
         """Repr based on class name and __str__."""
@@ -105,36 +306,21 @@ class MAC:
 
     def __str__(self):
         """Create string based on delimiter, group, and upper."""
-        grp = self._grp_
-
-        if isinstance(grp, int):
-            parts = ["".join(self[i : i + grp]) for i in range(0, len(self), grp)]
-        elif isinstance(grp, tuple):
-            parts = []
-            s = 0
-            for i in grp:
-                parts.append("".join(self[s : s + i]))
-                s += i
-
-        string = self._del_.join(parts)
-
-        if self._upper_:
-            string = string.upper()
-
-        if self._del_ == "":
-            return f"0x{string}"
-
-        return string
+        return _join_digits_(self._digits_, self._del_, self._grp_, self._upper_)
 
     @property
     def int(self):
         """Integer representation of address."""
-        return int(self.hex, 16)
+        return self._int_
 
     @property
     def hex(self):
         """Hexadecimal representation of address."""
-        return f'0x{"".join(self)}'
+        try:
+            return self._hex_
+        except AttributeError:
+            self._hex_ = f'0x{"".join(self._digits_)}'
+            return self._hex_
 
     @property
     def binary(self):
@@ -143,7 +329,11 @@ class MAC:
         Binary groups are padded with '0's to be 4 bits long,
         and are separated with a space to improve readability.
         """
-        return " ".join([bin(int(d, 16))[2:].zfill(4) for d in self])
+        try:
+            return self._binary_
+        except AttributeError:
+            self._binary_ = " ".join([_BIN_DIGITS_[d] for d in self._digits_])
+            return self._binary_
 
     def format(self, delimiter=None, group=None, upper=None):
         """Format address with given formatting options.
@@ -162,14 +352,11 @@ class MAC:
         if upper not in (True, False):
             upper = self._upper_
 
-        prop = dict(_del_=delimiter, _grp_=group or self._grp_, _upper_=upper)
-
-        if delimiter == "":
-            prop["_del_"] = delimiter
+        group = group or self._grp_
 
-        obj = type("_", (self.__class__,), prop)(self.hex)
+        _check_format_(delimiter, group, upper)
 
-        return str(obj)
+        return _join_digits_(self._digits_, delimiter, group, upper)
 
     @classmethod
     def verify(cls, address):
@@ -223,6 +410,128 @@ class MAC:
         else:
             raise ValueError(f"{address} did not pass verification.")
 
+    @classmethod
+    def random(cls, n=1, oui=None, locally_administered=None, unicast=None, seed=None, exclude=()):
+        """Return list of n unique random addresses.
+
+        Args:
+            n (int): number of addresses to generate.
+            oui: OUI object, string or 24 bit int to use as the first 24 bits.
+            locally_administered (bool): set (True) or clear (False)
+                the universal/local bit of the first octet.
+            unicast (bool): clear (True) or set (False)
+                the individual/group bit of the first octet.
+            seed: seed for reproducible results.
+            exclude: iterable of address objects, strings or ints
+                that must not be generated.
+
+        Raises:
+            TypeError: If oui or a flag is given for a class that restricts
+                the first digit, oui is given for a class shorter than 24 bits,
+                or oui or an excluded address is not a supported type.
+            ValueError: If n unique addresses can not be generated,
+                a flag contradicts the bits of oui,
+                or oui or an excluded address is out of range.
+        """
+        length = cls._len_
+        fixed_mask = 0
+        fixed_bits = 0
+        flags = (
+            ("locally_administered", locally_administered, 7, True),
+            ("unicast", unicast, 8, False),
+        )
+
+        if cls._lead_ is not None:
+            for name, value in [("oui", oui)] + [flag[:2] for flag in flags]:
+                if value is not None:
+                    raise TypeError(f"{name} is not supported for {cls.__name__}.")
+            fixed_mask |= 0xF << (length - 4)
+
+        if oui is not None:
+            if length < 24:
+                raise TypeError(f"oui is not supported for {length} bit {cls.__name__}.")
+            oui = _oui_int_(oui)
+            fixed_mask |= 0xFFFFFF << (length - 24)
+            fixed_bits |= oui << (length - 24)
+
+        for name, flag, bit, on in flags:
+            if flag is None:
+                continue
+
+            bit = 1 << (length - bit)
+            value = bit if flag == on else 0
+
+            if fixed_mask & bit and fixed_bits & bit != value:
+                raise ValueError(f"{name}={flag} contradicts oui {oui:06x}.")
+
+            fixed_mask |= bit
+            fixed_bits |= value
+
+        free_mask = ((1 << length) - 1) & ~fixed_mask
+        capacity = 2 ** bin(free_mask).count("1") * len(cls._lead_ or "0")
+        if n > capacity:
+            raise ValueError(f"can not generate {n} unique {cls.__name__} addresses.")
+
+        rng = Random(seed)
+        getrandbits = rng.getrandbits
+        leads = [int(d, 16) << (length - 4) for d in cls._lead_ or ()]
+
+        # excluded addresses are treated as already generated
+        seen = cls._ints_for_(exclude)
+        values = []
+        misses = 0
+        while len(values) < n:
+            value = (getrandbits(length) & free_mask) | fixed_bits
+            if leads:
+                value |= rng.choice(leads)
+
+            if value not in seen:
+                seen.add(value)
+                values.append(value)
+                continue
+
+            misses += 1
+            if misses > 100 * n + 1000:
+                raise ValueError(f"can not generate {n} unique {cls.__name__} addresses.")
+
+        return cls._from_ints_(values)
+
+    @classmethod
+    def sequence(cls, start, count, step=1, exclude=()):
+        """Return list of count addresses starting at start.
+
+        Args:
+            start: address object, string or int of the first address.
+            count (int): number of addresses to generate.
+            step (int): difference between consecutive addresses, not 0.
+            exclude: iterable of address objects, strings or ints
+                that are skipped.
+
+        Address objects of the same length as cls are taken by int.
+
+        Raises:
+            TypeError: If start or an excluded address is not a supported type.
+            ValueError: If step is 0, the sequence does not fit in cls._len_ bits
+                or an address does not meet the class restrictions.
+        """
+        if step == 0:
+            raise ValueError("step must not be 0.")
+
+        value = cls._address_int_(start)
+        exclude = cls._ints_for_(exclude)
+        maxint = 1 << cls._len_
+
+        values = []
+        while len(values) < count:
+            if not 0 <= value < maxint:
+                raise ValueError(f"sequence does not fit in {cls._len_} bits.")
+
+            if value not in exclude:
+                values.append(value)
+            value += step
+
+        return cls._from_ints_(values)
+
 
 class MAC_64(MAC):
     """Generic 64 bit MAC address object."""
@@ -238,23 +547,38 @@ class GUID(MAC):
     _del_ = "-"
 
 
+class OUI(MAC):
+    """24 bit Organizationally Unique Identifier."""
+
+    _len_ = 24
+
+
+class CID(MAC):
+    """24 bit Company ID."""
+
+    _len_ = 24
+
+
+class OUI36(MAC):
+    """36 bit Organizationally Unique Identifier."""
+
+    _len_ = 36
+
+
 class _EUI_Mixin_:
     """Define properties for EUI objects."""
 
     @property
     def oui(self):
-        obj = type("OUI", (MAC,), dict(_len_=24))
-        return obj("".join(self[:6]))
+        return OUI._from_int_(self.int >> (self._len_ - 24))
 
     @property
     def cid(self):
-        obj = type("CID", (MAC,), dict(_len_=24))
-        return obj("".join(self[:6]))
+        return CID._from_int_(self.int >> (self._len_ - 24))
 
     @property
     def oui36(self):
-        obj = type("OUI36", (MAC,), dict(_len_=36))
-        return obj("".join(self[:9]))
+        return OUI36._from_int_(self.int >> (self._len_ - 36))
 
 
 class EUI_48(MAC, _EUI_Mixin_):
@@ -262,6 +586,56 @@ class EUI_48(MAC, _EUI_Mixin_):
 
     _del_ = "-"
 
+    @staticmethod
+    def _eui64_int_(value, modified=False):
+        """Insert FFFE between OUI and extension identifier of int value."""
+        value = ((value >> 24) << 40) | (_EUI_FFFE_ << 24) | (value & 0xFFFFFF)
+        if modified:
+            value ^= _EUI_UL_BIT_
+        return value
+
+    def to_eui64(self, modified=False):
+        """Return EUI_64 derived from address by inserting FFFE.
+
+        Args:
+            modified (bool): True to also invert the universal/local bit,
+                creating the modified EUI-64 used by IPv6 (RFC 4291).
+        """
+        return EUI_64._from_int_(self._eui64_int_(self.int, modified))
+
+    def interface_id(self):
+        """Return the 8 byte IPv6 interface identifier (modified EUI-64)."""
+        return self._eui64_int_(self.int, True).to_bytes(8, "big")
+
+    @classmethod
+    def to_eui64_batch(cls, addresses, modified=False):
+        """Return list of EUI_64 derived from addresses.
+
+        Args:
+            addresses: iterable of EUI_48 instances or ints.
+            modified (bool): see to_eui64.
+
+        Raises:
+            TypeError: If an address is not an EUI_48 or int.
+            ValueError: If an int does not fit in 48 bits.
+        """
+        int_for = cls._int_for_
+        return [EUI_64._from_int_(cls._eui64_int_(int_for(a), modified)) for a in addresses]
+
+    @classmethod
+    def interface_id_batch(cls, addresses):
+        """Return list of interface identifiers for addresses.
+
+        Args:
+            addresses: iterable of EUI_48 instances or ints.
+
+        Raises:
+            TypeError: If an address is not an EUI_48 or int.
+            ValueError: If an int does not fit in 48 bits.
+        """
+        int_for = cls._int_for_
+        return [cls._eui64_int_(int_for(a), True).to_bytes(8, "big") for a in addresses]
+
 
 class EUI_64(MAC, _EUI_Mixin_):
     """Represent single EUI-64 object."""
@@ -269,6 +643,61 @@ class EUI_64(MAC, _EUI_Mixin_):
     _len_ = 64
     _del_ = "-"
 
+    @staticmethod
+    def _eui48_int_(value, modified=False):
+        """Remove FFFE between OUI and extension identifier of int value."""
+        if modified:
+            value ^= _EUI_UL_BIT_
+        if (value >> 24) & 0xFFFF != _EUI_FFFE_:
+            raise ValueError(f"{value:#018x} is not derived from an EUI-48.")
+        return ((value >> 40) << 24) | (value & 0xFFFFFF)
+
+    def to_eui48(self, modified=False):
+        """Return EUI_48 the address was derived from.
+
+        Args:
+            modified (bool): True if address is a modified EUI-64
+                with an inverted universal/local bit.
+
+        Raises:
+            ValueError: If address does not contain FFFE after the OUI.
+        """
+        return EUI_48._from_int_(self._eui48_int_(self.int, modified))
+
+    def interface_id(self):
+        """Return the 8 byte IPv6 interface identifier (modified EUI-64)."""
+        return (self.int ^ _EUI_UL_BIT_).to_bytes(8, "big")
+
+    @classmethod
+    def to_eui48_batch(cls, addresses, modified=False):
+        """Return list of EUI_48 the addresses were derived from.
+
+        Args:
+            addresses: iterable of EUI_64 instances or ints.
+            modified (bool): see to_eui48.
+
+        Raises:
+            TypeError: If an address is not an EUI_64 or int.
+            ValueError: If an int does not fit in 64 bits or an address
+                does not contain FFFE after the OUI.
+        """
+        int_for = cls._int_for_
+        return [EUI_48._from_int_(cls._eui48_int_(int_for(a), modified)) for a in addresses]
+
+    @classmethod
+    def interface_id_batch(cls, addresses):
+        """Return list of interface identifiers for addresses.
+
+        Args:
+            addresses: iterable of EUI_64 instances or ints.
+
+        Raises:
+            TypeError: If an address is not an EUI_64 or int.
+            ValueError: If an int does not fit in 64 bits.
+        """
+        int_for = cls._int_for_
+        return [(int_for(a) ^ _EUI_UL_BIT_).to_bytes(8, "big") for a in addresses]
+
 
 class _WWN_Mixin_:
     """Define properties for WWN objects."""
@@ -279,21 +708,21 @@ class _WWN_Mixin_:
 
     @property
     def oui(self):
-        obj = type("OUI", (MAC,), dict(_len_=24))
-
+        # NAA 1 and 2 have the oui in hex digits 4-9, NAA 5 and 6 in digits 1-6
         if self.naa in ("1", "2"):
-            return obj("".join(self[4:10]))
+            return OUI._from_int_((self.int >> (self._len_ - 40)) & 0xFFFFFF)
         elif self.naa in ("5", "6"):
-            return obj("".join(self[1:7]))
+            return OUI._from_int_((self.int >> (self._len_ - 28)) & 0xFFFFFF)
 
 
 class WWN(MAC, _WWN_Mixin_):
     """Represent single WWN object."""
 
     _len_ = 64
+    _lead_ = ("1", "2", "5")
 
     def _restrict_(self):
-        if self[0] not in ("1", "2", "5"):
+        if self[0] not in self._lead_:
             raise ValueError("First hex digit for WWN must be 1, 2, or 5")
 
 
@@ -301,9 +730,10 @@ class WWNx(MAC, _WWN_Mixin_):
     """Represent single 128 bit extended WWN object."""
 
     _len_ = 128
+    _lead_ = ("6",)
 
     def _restrict_(self):
-        if self[0] != "6":
+        if self[0] not in self._lead_:
             raise ValueError("First hex digit for WWNx must be 6")
 
 
@@ -323,6 +753,14 @@ class IB_GUID(EUI_64):
     _grp_ = 4
 
 
+class IB_GID_prefix(MAC):
+    """Represent single 64 bit Infiniband GID prefix object."""
+
+    _len_ = 64
+    _del_ = ":"
+    _grp_ = 4
+
+
 class IB_GID(MAC):
     """Represent single 128 bit Infiniband GID object."""
 
@@ -333,15 +771,12 @@ class IB_GID(MAC):
     @property
     def prefix(self):
         """Return embedded 64 bit Infiniband GID prefix."""
-        prop = dict(_len_=64, _del_=":", _grp_=4)
-
-        obj = type("IB_GID_prefix", (MAC,), prop)
-        return obj("".join(self[:16]))
+        return IB_GID_prefix._from_int_(self.int >> 64)
 
     @property
     def guid(self):
         """Return embedded 64 bit Infiniband GUID."""
-        return IB_GUID("".join(self[16:]))
+        return IB_GUID._from_int_(self.int & ((1 << 64) - 1))
 
 
 def new_hwaddress_class(name, length=48, delimiter=":", grouping=2, upper=False):
@@ -349,9 +784,7 @@ def new_hwaddress_class(name, length=48, delimiter=":", grouping=2, upper=False)
     if not isinstance(length, int):
         raise TypeError("length must be an int")
 
-    prop = dict(_len_=length, _del_=delimiter, _grp_=grouping, _upper_=upper)
-
-    obj = type(name, (MAC,), prop)
+    obj = _class_from_key_(name, length, grouping, delimiter, upper)
 
     # Try to create instance of object before returning
     obj("0" * int(length / 4))
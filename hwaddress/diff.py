@@ -0,0 +1,173 @@
+"""Incremental diff of periodic hardware address table snapshots."""
+
+from collections import namedtuple
+
+from hwaddress.core import MAC, _WWN_Mixin_, _oui_int_
+
+DiffEvent = namedtuple("DiffEvent", ("kind", "address", "old", "new"))
+DiffEvent.__doc__ = """Change between two snapshots.
+
+kind is 'add', 'remove' or 'change'. old is None for 'add',
+and new is None for 'remove'.
+"""
+
+_missing_ = object()
+
+
+class SnapshotDiff:
+    """Keep the last snapshot of an address table and report changes.
+
+    Each snapshot is an iterable of (address, attributes) records,
+    such as the (mac, port) entries of a switch forwarding table.
+    Addresses are kept as ints, equal hashable attributes share one object,
+    and hwaddress objects are only created for the reported changes.
+    """
+
+    def __init__(self, hwclass=MAC, ouis=None):
+        """Initialize empty snapshot.
+
+        Args:
+            hwclass: MAC or subclass of MAC of the addresses in the table.
+            ouis: optional iterable of OUI objects, strings or 24 bit ints.
+                Only addresses whose oui is in ouis are tracked.
+
+        Raises:
+            TypeError: If hwclass is not MAC or a subclass of MAC,
+                or an oui is not a supported type.
+            ValueError: If an oui does not fit in 24 bits.
+        """
+        if (not isinstance(hwclass, type)) or (not issubclass(hwclass, MAC)):
+            raise TypeError("hwclass must be 'MAC' or subclass of 'MAC'.")
+
+        self.hwclass = hwclass
+        self._state_ = {}
+        self._oui_shift_ = None if issubclass(hwclass, _WWN_Mixin_) else hwclass._len_ - 24
+
+        if ouis is None:
+            self._ouis_ = None
+        else:
+            self._ouis_ = {_oui_int_(o) for o in ouis}
+
+    def __len__(self):
+        """Number of addresses in the last snapshot."""
+        return len(self._state_)
+
+    def __contains__(self, address):
+        """Check if address is in the last snapshot."""
+        return self._key_(address) in self._state_
+
+    def __iter__(self):
+        """Iterate over addresses in the last snapshot."""
+        return (self.hwclass._from_int_(key) for key in self._state_)
+
+    def get(self, address, default=None):
+        """Return attributes of address in the last snapshot."""
+        return self._state_.get(self._key_(address), default)
+
+    def _key_(self, address):
+        """Return int key of hwclass object, string or int."""
+        if isinstance(address, str):
+            return self.hwclass(address).int
+        return self.hwclass._int_for_(address)
+
+    def _oui_(self, key):
+        """Return int of the oui of address key.
+
+        WWN classes use their oui property, other classes the first 24 bits.
+        """
+        if self._oui_shift_ is None:
+            return self.hwclass._from_int_(key).oui.int
+        return key >> self._oui_shift_
+
+    def update(self, records):
+        """Replace the snapshot with records and return the changes.
+
+        Args:
+            records: iterable of (address, attributes) tuples. Addresses may
+                be hwclass objects, strings or ints that fit in hwclass._len_
+                bits. Attributes are compared with '==' and should be hashable
+                to be shared. If an address is repeated, its last record wins.
+
+        Returns:
+            List of DiffEvent, at most one per address, 'add' and 'change'
+            events in record order
+            followed by 'remove' events.
+
+        Raises:
+            TypeError: If an address is not a hwclass object, string or int.
+            ValueError: If an address is not valid for hwclass.
+                The snapshot is not changed.
+        """
+        old_state = self._state_
+        ouis = self._ouis_
+        key_of = self._key_
+        box = self.hwclass._from_int_
+        maxint = 1 << self.hwclass._len_
+
+        state = {}
+        shared = {}
+        events = []
+        # position in events of the event of each added or changed address
+        position = {}
+        seen = 0
+
+        for address, attrs in records:
+            if address.__class__ is int and 0 <= address < maxint:
+                key = address
+            else:
+                key = key_of(address)
+
+            if ouis is not None and self._oui_(key) not in ouis:
+                continue
+
+            try:
+                attrs = shared.setdefault(attrs, attrs)
+            except TypeError:
+                pass
+
+            prev = state.get(key, _missing_)
+            state[key] = attrs
+
+            if prev is _missing_:
+                old = old_state.get(key, _missing_)
+                if old is _missing_:
+                    position[key] = len(events)
+                    events.append(DiffEvent("add", box(key), None, attrs))
+                else:
+                    seen += 1
+                    if old != attrs:
+                        position[key] = len(events)
+                        events.append(DiffEvent("change", box(key), old, attrs))
+                continue
+
+            if prev == attrs:
+                continue
+
+            # address repeated within the snapshot, last record wins
+            old = old_state.get(key, _missing_)
+            if old is _missing_:
+                event = DiffEvent("add", box(key), None, attrs)
+            elif old != attrs:
+                event = DiffEvent("change", box(key), old, attrs)
+            else:
+                event = None
+
+            index = position.get(key)
+            if index is not None:
+                events[index] = event
+            elif event is not None:
+                position[key] = len(events)
+                events.append(event)
+
+        if None in events:
+            # repeated addresses that ended up equal to the last snapshot
+            events = [event for event in events if event is not None]
+
+        if seen < len(old_state):
+            for key, old in old_state.items():
+                if key not in state:
+                    events.append(DiffEvent("remove", box(key), old, None))
+
+        self._state_ = state
+
+        return events
@@ -0,0 +1,734 @@
+"""Pandas and Arrow extension types for hwaddress columns.
+
+Requires the optional ``pandas`` extra (``pip install hwaddress[pandas]``).
+Importing this module registers the ``hwaddress`` pandas dtype, the ``hw``
+Series accessor, and the ``hwaddress.hwaddress`` Arrow extension type.
+
+Addresses are stored as fixed-width unsigned integers. Addresses of up to
+64 bits use a single uint64 word, wider addresses use one uint64 word per
+64 bits, most significant word first.
+"""
+
+import json
+import numbers
+import re
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    register_series_accessor,
+)
+from pandas.api.indexers import check_array_indexer
+
+from hwaddress import core
+from hwaddress.core import (
+    MAC,
+    OUI,
+    _check_format_,
+    _class_by_name_,
+    _class_from_key_,
+    _class_from_ref_,
+    _class_key_,
+    _class_ref_,
+    _registry_,
+)
+
+_WORD_ = 64
+_WORD_MASK_ = (1 << _WORD_) - 1
+
+
+def _code_points_(string):
+    """Return uint32 ndarray of the unicode code points of string."""
+    return np.array([ord(c) for c in string], dtype=np.uint32)
+
+
+def _hex_table_(digits):
+    """Return (256, 2) ndarray of the code points of the two hex digits of each byte."""
+    digits = _code_points_(digits)
+    return np.stack([np.repeat(digits, 16), np.tile(digits, 16)], axis=1)
+
+
+_HEX_TABLE_ = {False: _hex_table_("0123456789abcdef"), True: _hex_table_("0123456789ABCDEF")}
+
+
+def _builtin_classes_():
+    """Return hwaddress classes defined in hwaddress.core keyed by name."""
+    return {
+        name: obj
+        for name, obj in vars(core).items()
+        if isinstance(obj, type) and issubclass(obj, MAC)
+    }
+
+
+def _words_(hwclass):
+    """Return number of 64 bit words needed to store an address of hwclass."""
+    return -(-hwclass._len_ // _WORD_)
+
+
+def _from_words_(row):
+    """Join a row of 64 bit words into an int."""
+    value = 0
+    for word in row:
+        value = (value << _WORD_) | int(word)
+    return value
+
+
+class HWAddressDtype(ExtensionDtype):
+    """Pandas dtype for columns of a single hwaddress class."""
+
+    na_value = pd.NA
+    _metadata = ("hwclass",)
+    _name_re_ = re.compile(r"^hwaddress\[(?P<name>\w+)\]$")
+
+    def __init__(self, hwclass=MAC):
+        """Initialize dtype.
+
+        Args:
+            hwclass: MAC or subclass of MAC stored in the column.
+
+        Raises:
+            TypeError: If hwclass is not MAC or a subclass of MAC.
+        """
+        if (not isinstance(hwclass, type)) or (not issubclass(hwclass, MAC)):
+            raise TypeError("hwclass must be 'MAC' or subclass of 'MAC'.")
+
+        self.hwclass = hwclass
+
+    @property
+    def type(self):
+        """Scalar type of the column."""
+        return self.hwclass
+
+    @property
+    def name(self):
+        """String identifying the dtype."""
+        return f"hwaddress[{self.hwclass.__name__}]"
+
+    @property
+    def words(self):
+        """Number of 64 bit words used to store each address."""
+        return _words_(self.hwclass)
+
+    @classmethod
+    def construct_array_type(cls):
+        """Return array type associated with this dtype."""
+        return HWAddressArray
+
+    @classmethod
+    def construct_from_string(cls, string):
+        """Construct dtype from 'hwaddress' or 'hwaddress[<class name>]'.
+
+        The name is looked up in the built-in classes, then in the classes
+        registered by new_hwaddress_class. Names registered more than once
+        are ambiguous and can not be used.
+        """
+        if not isinstance(string, str):
+            raise TypeError(f"'construct_from_string' expects a string, got {type(string)}")
+
+        if string == "hwaddress":
+            return cls()
+
+        match = cls._name_re_.match(string)
+        if match:
+            name = match.group("name")
+            hwclass = _builtin_classes_().get(name)
+            if hwclass is not None:
+                return cls(hwclass)
+
+            found = [obj for key, obj in _registry_.items() if key[0] == name]
+            if len(found) == 1:
+                return cls(found[0])
+
+        raise TypeError(f"Cannot construct a '{cls.__name__}' from '{string}'")
+
+    def __eq__(self, other):
+        """Equity based on the format defining attributes of the class."""
+        if isinstance(other, str):
+            return other == self.name
+        if isinstance(other, HWAddressDtype):
+            return _class_key_(self.hwclass) == _class_key_(other.hwclass)
+        return False
+
+    def __hash__(self):
+        """Make hashable."""
+        return hash(_class_key_(self.hwclass))
+
+    def __reduce__(self):
+        """Pickle by class reference so dynamically created classes can be restored."""
+        return (_dtype_from_ref_, (_class_ref_(self.hwclass),))
+
+    def __from_arrow__(self, array):
+        """Construct HWAddressArray from pyarrow Array or ChunkedArray."""
+        chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+
+        arrays = []
+        for chunk in chunks:
+            if isinstance(chunk, pa.ExtensionArray):
+                chunk = chunk.storage
+
+            mask = chunk.is_null().to_numpy(zero_copy_only=False)
+
+            if self.words == 1:
+                data = chunk.fill_null(0).to_numpy(zero_copy_only=False)
+            else:
+                start = chunk.offset * self.words
+                stop = start + len(chunk) * self.words
+                data = chunk.values.slice(start, stop - start).fill_null(0)
+                data = data.to_numpy(zero_copy_only=False)
+
+            data = np.asarray(data, dtype=np.uint64).reshape(-1, self.words)
+            arrays.append(HWAddressArray(data, mask, self))
+
+        if not arrays:
+            return HWAddressArray._empty_(self)
+
+        return HWAddressArray._concat_same_type(arrays)
+
+
+def _dtype_from_ref_(ref):
+    """Recreate pickled HWAddressDtype from class reference."""
+    return HWAddressDtype(_class_from_ref_(ref))
+
+
+def _scalar_int_(hwclass, scalar):
+    """Return int value of scalar for hwclass, None for missing values.
+
+    hwaddress objects of other classes are parsed from their hex string
+    and ints must fit in hwclass._len_ bits.
+    """
+    if not isinstance(scalar, (str, MAC)) and pd.isna(scalar):
+        return None
+    if isinstance(scalar, MAC) and _class_key_(type(scalar)) == _class_key_(hwclass):
+        return scalar.int
+    if isinstance(scalar, MAC):
+        scalar = scalar.hex
+    if isinstance(scalar, numbers.Integral) and not isinstance(scalar, bool):
+        return hwclass._int_for_(int(scalar))
+    return hwclass(scalar).int
+
+
+class HWAddressArray(ExtensionArray):
+    """Pandas extension array storing hwaddress objects as fixed-width integers."""
+
+    def __init__(self, data, mask, dtype):
+        """Initialize array.
+
+        Args:
+            data: uint64 ndarray of shape (n, dtype.words).
+            mask: bool ndarray of shape (n,), True where value is missing.
+            dtype: HWAddressDtype of the array.
+        """
+        self._data = data
+        self._mask = mask
+        self._dtype = dtype
+
+    @classmethod
+    def _empty_(cls, dtype):
+        """Return empty array of dtype."""
+        data = np.zeros((0, dtype.words), dtype=np.uint64)
+        return cls(data, np.zeros(0, dtype=bool), dtype)
+
+    @classmethod
+    def _from_ints_(cls, values, dtype):
+        """Create array from an iterable of ints, None for missing values."""
+        values = np.array(list(values), dtype=object)
+        mask = np.equal(values, None)
+        values = np.where(mask, 0, values)
+
+        invalid = (values < 0) | (values >= 1 << dtype.hwclass._len_)
+        if invalid.any():
+            raise ValueError(f"{values[invalid][0]} can not fit in {dtype.hwclass._len_} bits.")
+
+        words = dtype.words
+        if words == 1:
+            data = values.astype(np.uint64).reshape(-1, 1)
+        else:
+            shifts = [_WORD_ * (words - i - 1) for i in range(words)]
+            data = [((values >> shift) & _WORD_MASK_).astype(np.uint64) for shift in shifts]
+            data = np.stack(data, axis=1)
+
+        return cls(data, mask, dtype)
+
+    @classmethod
+    def _from_sequence(cls, scalars, dtype=None, copy=False):
+        """Create array from hwaddress objects, address strings or ints."""
+        if isinstance(dtype, str):
+            dtype = HWAddressDtype.construct_from_string(dtype)
+        elif dtype is None:
+            dtype = HWAddressDtype()
+
+        if isinstance(scalars, HWAddressArray) and scalars.dtype == dtype:
+            return scalars.copy() if copy else scalars
+
+        hwclass = dtype.hwclass
+        return cls._from_ints_((_scalar_int_(hwclass, s) for s in scalars), dtype)
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, dtype=None, copy=False):
+        """Create array from address strings."""
+        return cls._from_sequence(strings, dtype=dtype, copy=copy)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        """Reconstruct array after factorization."""
+        return cls._from_ints_(values, original.dtype)
+
+    @property
+    def dtype(self):
+        """HWAddressDtype of the array."""
+        return self._dtype
+
+    @property
+    def nbytes(self):
+        """Number of bytes used to store the array."""
+        return self._data.nbytes + self._mask.nbytes
+
+    def __len__(self):
+        """Number of addresses in the array."""
+        return len(self._mask)
+
+    def _int_(self, i):
+        """Return int value at position i."""
+        return _from_words_(self._data[i])
+
+    def _box_(self, value):
+        """Return hwaddress object for int value."""
+        return self.dtype.hwclass._from_int_(value)
+
+    def __getitem__(self, item):
+        """Return hwaddress object or new array."""
+        if isinstance(item, numbers.Integral):
+            if self._mask[item]:
+                return self.dtype.na_value
+            return self._box_(self._int_(item))
+
+        if not isinstance(item, (slice, tuple)):
+            item = check_array_indexer(self, item)
+
+        return type(self)(self._data[item], self._mask[item], self.dtype)
+
+    def __setitem__(self, key, value):
+        """Set values from hwaddress objects or address strings."""
+        if not isinstance(key, (numbers.Integral, slice)):
+            key = check_array_indexer(self, key)
+
+        if pd.api.types.is_list_like(value) and not isinstance(value, (str, MAC)):
+            value = self._from_sequence(value, dtype=self.dtype)
+        else:
+            value = self._from_sequence([value], dtype=self.dtype)
+            if not isinstance(key, numbers.Integral):
+                value = value.take(np.zeros(len(self._mask[key]), dtype=np.intp))
+
+        if isinstance(key, numbers.Integral):
+            self._data[key] = value._data[0]
+            self._mask[key] = value._mask[0]
+        else:
+            self._data[key] = value._data
+            self._mask[key] = value._mask
+
+    def __iter__(self):
+        """Iterate over hwaddress objects."""
+        for i in range(len(self)):
+            yield self[i]
+
+    def __array__(self, dtype=None, copy=None):
+        """Convert to object ndarray of hwaddress objects."""
+        result = np.empty(len(self), dtype=object)
+        for i in range(len(self)):
+            result[i] = self[i]
+
+        if dtype is None or np.dtype(dtype) == object:
+            return result
+
+        # hwaddress objects are sequences of digits, convert their strings instead
+        return np.array([str(value) for value in result], dtype=dtype)
+
+    def __eq__(self, other):
+        """Elementwise equity."""
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+
+        if not isinstance(other, HWAddressArray):
+            if isinstance(other, (str, MAC)):
+                other = [other]
+            other = self._from_sequence(other, dtype=self.dtype)
+            if len(other) == 1:
+                other = other.take(np.zeros(len(self), dtype=np.intp))
+
+        if other.dtype != self.dtype:
+            return np.zeros(len(self), dtype=bool)
+
+        result = (self._data == other._data).all(axis=1)
+        return result & ~self._mask & ~other._mask
+
+    def isna(self):
+        """Boolean array indicating missing values."""
+        return self._mask.copy()
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        """Take elements from the array."""
+        indices = np.asarray(indices, dtype=np.intp)
+
+        if allow_fill:
+            if fill_value is not None and fill_value is not pd.NA:
+                raise ValueError("fill_value must be a missing value.")
+            if (indices < -1).any():
+                raise ValueError("indices must be >= -1 when allow_fill is True.")
+            fill = indices == -1
+            if len(self) == 0 and not fill.all():
+                raise IndexError("cannot do a non-empty take from an empty array.")
+            if len(self) == 0:
+                data = np.zeros((len(indices), self.dtype.words), dtype=np.uint64)
+                return type(self)(data, fill, self.dtype)
+            safe = np.where(fill, 0, indices)
+            return type(self)(self._data[safe], self._mask[safe] | fill, self.dtype)
+
+        return type(self)(self._data[indices], self._mask[indices], self.dtype)
+
+    def copy(self):
+        """Return a copy of the array."""
+        return type(self)(self._data.copy(), self._mask.copy(), self.dtype)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        """Concatenate multiple arrays of the same dtype."""
+        to_concat = list(to_concat)
+        data = np.concatenate([a._data for a in to_concat])
+        mask = np.concatenate([a._mask for a in to_concat])
+        return cls(data, mask, to_concat[0].dtype)
+
+    def _int_values_(self):
+        """Return ints of all rows, including missing values, as an object ndarray."""
+        values = self._data[:, 0].astype(object)
+        for i in range(1, self.dtype.words):
+            values = (values << _WORD_) | self._data[:, i].astype(object)
+        return values
+
+    def _bytes_(self):
+        """Return (n, words * 8) uint8 ndarray of the words as big-endian bytes."""
+        data = self._data.astype(">u8")
+        return data.view(np.uint8).reshape(len(self), self.dtype.words * 8)
+
+    def _values_for_argsort(self):
+        """Return values ordered the same way as the addresses."""
+        if self.dtype.words == 1:
+            return self._data[:, 0]
+        return self._int_values_()
+
+    def _values_for_factorize(self):
+        """Return hashable values and the value used for missing values."""
+        return self.ints(), None
+
+    def isin(self, values):
+        """Return boolean ndarray, True where the address is in values.
+
+        Values that are not valid for the dtype never match,
+        missing values match missing addresses.
+        """
+        hwclass = self.dtype.hwclass
+        ints = []
+        na = False
+
+        for value in values:
+            try:
+                value = _scalar_int_(hwclass, value)
+            except (TypeError, ValueError):
+                continue
+            if value is None:
+                na = True
+            else:
+                ints.append(value)
+
+        other = self._from_ints_(ints, self.dtype)
+        result = np.isin(self._values_for_argsort(), other._values_for_argsort())
+
+        return np.where(self._mask, na, result)
+
+    def searchsorted(self, value, side="left", sorter=None):
+        """Find indices where addresses should be inserted to maintain order."""
+        scalar = not pd.api.types.is_list_like(value) or isinstance(value, (str, MAC))
+        other = self._from_sequence([value] if scalar else value, dtype=self.dtype)
+
+        result = np.searchsorted(
+            self._values_for_argsort(), other._values_for_argsort(), side=side, sorter=sorter
+        )
+
+        return result[0] if scalar else result
+
+    def _reduce(self, name, *, skipna=True, **kwargs):
+        """Return min or max address, other reductions are not supported."""
+        if name not in ("min", "max"):
+            return super()._reduce(name, skipna=skipna, **kwargs)
+
+        mask = self._mask
+        if mask.all() or (mask.any() and not skipna):
+            result = self.dtype.na_value
+        else:
+            valid = np.flatnonzero(~mask)
+            values = self._values_for_argsort()[valid]
+            result = self[valid[values.argmin() if name == "min" else values.argmax()]]
+
+        if kwargs.get("keepdims"):
+            return self._from_sequence([result], dtype=self.dtype)
+
+        return result
+
+    def _formatter(self, boxed=False):
+        """Format values as strings defined by the hwaddress class."""
+        return str
+
+    def __arrow_array__(self, type=None):
+        """Convert to pyarrow extension array."""
+        arrow_type = HWAddressArrowType(self.dtype.hwclass)
+
+        if self.dtype.words == 1:
+            storage = pa.array(self._data[:, 0], type=pa.uint64(), mask=self._mask)
+        else:
+            mask = pa.array(self._mask) if self._mask.any() else None
+            values = pa.array(self._data.ravel(), type=pa.uint64())
+            storage = pa.FixedSizeListArray.from_arrays(values, self.dtype.words, mask=mask)
+
+        return pa.ExtensionArray.from_storage(arrow_type, storage)
+
+    def ints(self):
+        """Return address ints as an object ndarray, None for missing values."""
+        values = self._int_values_()
+        values[self._mask] = None
+        return values
+
+    def format(self, delimiter=None, group=None, upper=None):
+        """Format addresses with given formatting options.
+
+        See MAC.format for a description of the options.
+
+        Raises:
+            AttributeError: If an option does not conform to restraints.
+        """
+        hwclass = self.dtype.hwclass
+
+        if delimiter is None:
+            delimiter = hwclass._del_
+
+        if upper not in (True, False):
+            upper = hwclass._upper_
+
+        group = group or hwclass._grp_
+
+        _check_format_(delimiter, group, upper)
+
+        # hex digit characters of each row, from the two characters of each byte
+        size = len(self)
+        width = hwclass._len_ // 4
+        chars = _HEX_TABLE_[upper][self._bytes_()].reshape(size, self.dtype.words * 16)
+        chars = chars[:, chars.shape[1] - width :]
+
+        # same groups as _join_digits_
+        if isinstance(group, int):
+            bounds = [(i, i + group) for i in range(0, width, group)]
+        else:
+            bounds = []
+            s = 0
+            for i in group:
+                bounds.append((s, s + i))
+                s += i
+
+        def const(string):
+            points = _code_points_(string)
+            return np.broadcast_to(points, (size, len(points)))
+
+        sep = const(delimiter.upper() if upper else delimiter)
+        parts = [const("0x")] if delimiter == "" else []
+        for i, (start, stop) in enumerate(bounds):
+            if i:
+                parts.append(sep)
+            parts.append(chars[:, start:stop])
+
+        # rows of code points are viewed as unicode strings, the trailing NUL
+        # column keeps the width above 0 and is stripped by the string dtype
+        parts.append(np.zeros((size, 1), dtype=np.uint32))
+        out = np.ascontiguousarray(np.hstack(parts))
+        result = out.view(f"U{out.shape[1]}").reshape(size).astype(object)
+        result[self._mask] = pd.NA
+
+        return result
+
+
+def _bits_(array, start, stop):
+    """Return uint64 ndarray of hex digits [start:stop] of each address in array.
+
+    At most 16 digits can be returned. Values of missing addresses are undefined.
+    """
+    length = array.dtype.hwclass._len_
+
+    if array.dtype.words == 1:
+        shift = np.uint64(length - stop * 4)
+        mask = np.uint64((1 << ((stop - start) * 4)) - 1)
+        return (array._data[:, 0] >> shift) & mask
+
+    data = array._bytes_()
+    offset = array.dtype.words * 16 - length // 4
+    values = np.zeros(len(array), dtype=np.uint64)
+    for i in range(offset + start, offset + stop):
+        byte = data[:, i // 2]
+        digit = byte & 0xF if i % 2 else byte >> 4
+        values = (values << np.uint64(4)) | digit.astype(np.uint64)
+
+    return values
+
+
+class HWAddressArrowType(pa.ExtensionType):
+    """Arrow extension type storing a hwaddress class as fixed-width integers."""
+
+    _name_ = "hwaddress.hwaddress"
+
+    def __init__(self, hwclass):
+        """Initialize Arrow type for hwclass."""
+        self.hwclass = hwclass
+        words = _words_(hwclass)
+
+        if words == 1:
+            storage = pa.uint64()
+        else:
+            storage = pa.list_(pa.uint64(), words)
+
+        super().__init__(storage, self._name_)
+
+    def __arrow_ext_serialize__(self):
+        """Serialize class attributes, and module and name if importable, as JSON."""
+        keys = ("name", "length", "grouping", "delimiter", "upper")
+        attrs = dict(zip(keys, _class_key_(self.hwclass)))
+
+        if _class_by_name_(self.hwclass.__module__, self.hwclass.__qualname__) is self.hwclass:
+            attrs["module"] = self.hwclass.__module__
+            attrs["qualname"] = self.hwclass.__qualname__
+
+        return json.dumps(attrs).encode()
+
+    @classmethod
+    def __arrow_ext_deserialize__(cls, storage_type, serialized):
+        """Recreate Arrow type and its hwaddress class from JSON.
+
+        The class is looked up by module and name in the imported modules,
+        and recreated from its attributes if it is missing or does not match.
+        """
+        attrs = json.loads(serialized.decode())
+        module = attrs.pop("module", None)
+        qualname = attrs.pop("qualname", None)
+
+        if isinstance(attrs["grouping"], list):
+            attrs["grouping"] = tuple(attrs["grouping"])
+
+        hwclass = None if module is None else _class_by_name_(module, qualname)
+        if not (
+            isinstance(hwclass, type)
+            and issubclass(hwclass, MAC)
+            and _class_key_(hwclass) == tuple(attrs.values())
+        ):
+            hwclass = _class_from_key_(**attrs)
+
+        return cls(hwclass)
+
+    def to_pandas_dtype(self):
+        """Return pandas dtype for this Arrow type."""
+        return HWAddressDtype(self.hwclass)
+
+
+@register_series_accessor("hw")
+class HWAddressAccessor:
+    """Vectorized hwaddress methods for pandas Series, available as Series.hw."""
+
+    _oui_ = OUI
+
+    def __init__(self, series):
+        """Initialize accessor for series."""
+        self._series = series
+
+    def _array_(self):
+        """Return HWAddressArray of series or raise AttributeError."""
+        if not isinstance(self._series.dtype, HWAddressDtype):
+            raise AttributeError("Can only use .hw accessor with hwaddress dtype values.")
+        return self._series.array
+
+    def _wrap_(self, values, dtype=None, name=None):
+        """Return Series with index of the accessed series."""
+        return pd.Series(values, index=self._series.index, dtype=dtype, name=name)
+
+    def format(self, delimiter=None, group=None, upper=None):
+        """Format addresses with given formatting options.
+
+        See MAC.format for a description of the options.
+        """
+        values = self._array_().format(delimiter, group, upper)
+        return self._wrap_(values, dtype=object, name=self._series.name)
+
+    def fillna(self, value):
+        """Fill missing values with a hwaddress object or address string.
+
+        Series.fillna only accepts address strings, since pandas rejects
+        fill values that are sequences, like hwaddress objects.
+        """
+        array = self._array_()
+        fill = HWAddressArray._from_sequence([value], dtype=array.dtype)
+
+        result = array.copy()
+        result._data[array._mask] = fill._data[0]
+        result._mask[array._mask] = fill._mask[0]
+
+        return self._wrap_(result, name=self._series.name)
+
+    @property
+    def int(self):
+        """Integer representation of addresses as Python ints."""
+        return self._wrap_(self._array_().ints(), dtype=object, name=self._series.name)
+
+    @property
+    def oui(self):
+        """24-bit Organizationally Unique Identifier of EUI and WWN addresses.
+
+        Follows the oui property of the hwaddress class.
+        """
+        array = self._array_()
+        hwclass = array.dtype.hwclass
+
+        if issubclass(hwclass, core._EUI_Mixin_):
+            values = _bits_(array, 0, 6)
+            mask = array._mask
+        elif issubclass(hwclass, core._WWN_Mixin_):
+            naa = _bits_(array, 0, 1)
+            values = np.where(np.isin(naa, (1, 2)), _bits_(array, 4, 10), _bits_(array, 1, 7))
+            mask = array._mask | ~np.isin(naa, (1, 2, 5, 6))
+        else:
+            raise AttributeError(f"'{hwclass.__name__}' addresses have no oui.")
+
+        data = np.where(mask, np.uint64(0), values).reshape(-1, 1)
+        result = HWAddressArray(data, mask.copy(), HWAddressDtype(self._oui_))
+        return self._wrap_(result, name="oui")
+
+    def verify(self, hwclass=None):
+        """Verify that values conform to formatting defined by hwclass.
+
+        Values of a hwaddress dtype Series are verified using their string
+        representation, and hwclass defaults to the class of the dtype.
+        Missing values never verify.
+        """
+        series = self._series
+
+        if isinstance(series.dtype, HWAddressDtype):
+            if hwclass is None:
+                hwclass = series.dtype.hwclass
+            values = self._array_().format()
+        else:
+            if hwclass is None:
+                raise TypeError("hwclass is required for Series without a hwaddress dtype.")
+            values = series.to_numpy(dtype=object)
+
+        result = [isinstance(v, str) and hwclass.verify(v) for v in values]
+        return self._wrap_(result, dtype=bool, name=series.name)
+
+
+register_extension_dtype(HWAddressDtype)
+pa.register_extension_type(HWAddressArrowType(MAC))
@@ -0,0 +1,105 @@
+"""unittests for snapshot diff."""
+
+import unittest
+from hwaddress import MAC, EUI_48, EUI_64, WWN, DiffEvent, SnapshotDiff
+
+
+class SnapshotDiffs(unittest.TestCase):
+    """Test SnapshotDiff."""
+
+    def test_update(self):
+        """Test add, remove and change events."""
+        table = SnapshotDiff(EUI_48)
+
+        first = [("12-34-56-78-90-ab", "Gi1/1"), (EUI_48("12-34-56-78-90-ac"), "Gi1/2")]
+        events = table.update(first)
+
+        self.assertEqual([e.kind for e in events], ["add", "add"])
+        self.assertEqual(events[0], DiffEvent("add", EUI_48("12-34-56-78-90-ab"), None, "Gi1/1"))
+        self.assertEqual(table.update(first), [])
+        self.assertEqual(len(table), 2)
+
+        second = [
+            (EUI_48("12-34-56-78-90-ab").int, "Gi1/3"),
+            ("22-34-56-78-90-ab", "Gi1/1"),
+            ("22-34-56-78-90-ab", "Gi1/4"),
+        ]
+        events = table.update(second)
+
+        self.assertEqual(
+            events,
+            [
+                DiffEvent("change", EUI_48("12-34-56-78-90-ab"), "Gi1/1", "Gi1/3"),
+                DiffEvent("add", EUI_48("22-34-56-78-90-ab"), None, "Gi1/4"),
+                DiffEvent("remove", EUI_48("12-34-56-78-90-ac"), "Gi1/2", None),
+            ],
+        )
+        self.assertIn("12-34-56-78-90-ab", table)
+        self.assertNotIn("12-34-56-78-90-ac", table)
+        self.assertEqual(table.get("22-34-56-78-90-ab"), "Gi1/4")
+        self.assertEqual(sorted(table), [EUI_48("12-34-56-78-90-ab"), EUI_48("22-34-56-78-90-ab")])
+
+    def test_repeated_addresses(self):
+        """Test that repeated addresses give at most one event, last record wins."""
+        table = SnapshotDiff()
+        table.update([(1, "A"), (2, "A")])
+
+        self.assertEqual(table.update([(1, "B"), (1, "A"), (2, "A"), (2, "A")]), [])
+        self.assertEqual(
+            table.update([(3, "A"), (1, "A"), (3, "B"), (1, "C"), (1, "D")]),
+            [
+                DiffEvent("add", MAC._from_int_(3), None, "B"),
+                DiffEvent("change", MAC._from_int_(1), "A", "D"),
+                DiffEvent("remove", MAC._from_int_(2), "A", None),
+            ],
+        )
+        self.assertEqual(table.get(1), "D")
+
+    def test_unhashable_attrs(self):
+        """Test that unhashable attributes are compared by value."""
+        table = SnapshotDiff()
+        table.update([("12:34:56:78:90:ab", {"port": 1})])
+
+        self.assertEqual(table.update([("12:34:56:78:90:ab", {"port": 1})]), [])
+        self.assertEqual(table.update([("12:34:56:78:90:ab", {"port": 2})])[0].kind, "change")
+
+    def test_oui_filter(self):
+        """Test that only addresses with given ouis are tracked."""
+        table = SnapshotDiff(MAC, ouis=["12:34:56", EUI_48("22-34-56-00-00-00").oui])
+        records = [("12:34:56:78:90:ab", 1), ("22:34:56:78:90:ab", 2), ("32:34:56:78:90:ab", 3)]
+
+        self.assertEqual(len(table.update(records)), 2)
+        self.assertNotIn("32:34:56:78:90:ab", table)
+
+        wwns = SnapshotDiff(WWN, ouis=[0x567890, 0x234567])
+        records = [
+            ("12:34:56:78:90:ab:cd:ef", 1),
+            ("52:34:56:78:90:ab:cd:ef", 2),
+            ("53:34:56:78:90:ab:cd:ef", 3),
+        ]
+
+        self.assertEqual([e.new for e in wwns.update(records)], [1, 2])
+        self.assertRaises(TypeError, SnapshotDiff, str)
+        self.assertRaises(TypeError, SnapshotDiff, MAC, ouis=[EUI_48("12-34-56-78-90-ab")])
+        self.assertRaises(ValueError, SnapshotDiff, MAC, ouis=[1 << 24])
+
+    def test_invalid_addresses(self):
+        """Test that invalid addresses raise and leave the snapshot unchanged."""
+        table = SnapshotDiff(EUI_48)
+        table.update([(1, "Gi1/1")])
+
+        for address, error in (
+            (1 << 48, ValueError),
+            (-1, ValueError),
+            (True, TypeError),
+            (MAC("00:00:00:00:00:02"), TypeError),
+            (EUI_64("00-00-00-00-00-00-00-02"), TypeError),
+            (WWN("52:34:56:78:90:ab:cd:ef"), TypeError),
+        ):
+            self.assertRaises(error, table.update, [(2, "Gi1/2"), (address, "Gi1/3")])
+
+        self.assertEqual(list(table), [EUI_48._from_int_(1)])
+        self.assertEqual(table.update([(EUI_48("00-00-00-00-00-01"), "Gi1/1")]), [])
+        self.assertRaises(
+            TypeError, SnapshotDiff(MAC).update, [(EUI_64("00-00-00-00-00-00-00-02"), 1)]
+        )
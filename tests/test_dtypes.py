@@ -0,0 +1,263 @@
+"""unittests for pandas and arrow extension types."""
+
+import pickle
+import unittest
+
+try:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+    from hwaddress.dtypes import HWAddressArray, HWAddressArrowType, HWAddressDtype
+except ImportError:  # pragma: no cover
+    pd = None
+
+from hwaddress import MAC, EUI_48, WWN, WWNx, IB_LID, IB_GID, new_hwaddress_class
+
+
+@unittest.skipIf(pd is None, "pandas extra is not installed")
+class HWAddressSeries(unittest.TestCase):
+    """Test hwaddress dtype Series."""
+
+    def test_dtype(self):
+        """Test dtype construction and equity."""
+        self.assertEqual(pd.api.types.pandas_dtype("hwaddress[EUI_48]"), HWAddressDtype(EUI_48))
+        self.assertEqual(pd.api.types.pandas_dtype("hwaddress"), HWAddressDtype(MAC))
+        self.assertEqual(HWAddressDtype(EUI_48), "hwaddress[EUI_48]")
+        self.assertEqual(len({HWAddressDtype(), HWAddressDtype(MAC)}), 1)
+        self.assertIs(HWAddressDtype(WWN).type, WWN)
+        self.assertRaises(TypeError, HWAddressDtype.construct_from_string, 1)
+        self.assertRaises(TypeError, HWAddressDtype.construct_from_string, "hwaddress[Potato]")
+        self.assertEqual(pd.api.types.pandas_dtype("hwaddress[OUI]").type.__name__, "OUI")
+
+        T5MAC = new_hwaddress_class("T5MAC", 48, ".", 4, False)
+        self.assertIs(pd.api.types.pandas_dtype("hwaddress[T5MAC]").hwclass, T5MAC)
+
+        new_hwaddress_class("T5MAC", 64, ".", 4, False)
+        self.assertRaises(TypeError, HWAddressDtype.construct_from_string, "hwaddress[T5MAC]")
+        self.assertNotEqual(HWAddressDtype(MAC), HWAddressDtype(EUI_48))
+        self.assertRaises(TypeError, HWAddressDtype, str)
+
+    def test_series(self):
+        """Test Series creation, formatting, sorting and groupby."""
+        addrs = ["22-34-56-78-90-ab", "12:34:56:78:90:ab", None]
+        ser = pd.Series(addrs, dtype="hwaddress[EUI_48]")
+
+        self.assertEqual(ser[1], EUI_48("12-34-56-78-90-ab"))
+        self.assertTrue(ser.isna()[2])
+        self.assertEqual(list(ser.hw.format())[:2], ["22-34-56-78-90-ab", "12-34-56-78-90-ab"])
+        self.assertEqual(ser.hw.format(":", 4, True)[0], "2234:5678:90AB")
+        self.assertEqual(str(ser.hw.oui[0]), "22:34:56")
+        self.assertEqual(ser.hw.int[1], EUI_48("12-34-56-78-90-ab").int)
+        self.assertRaises(AttributeError, lambda: pd.Series([1]).hw.format())
+        self.assertRaises(AttributeError, lambda: pd.Series(ser, dtype="hwaddress[MAC]").hw.oui)
+        self.assertEqual(list(ser.hw.verify()), [True, True, False])
+        self.assertEqual(list(ser.sort_values().hw.format()[:2]), list(ser.hw.format()[1::-1]))
+
+        self.assertEqual(ser.dropna().value_counts().iloc[0], 1)
+        self.assertEqual(ser.hw.format(" ", (4, 8))[0], "2234 567890ab")
+        self.assertEqual(ser.hw.format("", upper=True)[1], "0x1234567890AB")
+        self.assertRaises(AttributeError, ser.hw.format, 5)
+
+        oui = ser.hw.oui
+        self.assertEqual(pd.Series(oui.astype(str), dtype=oui.dtype.name).tolist(), oui.tolist())
+
+    def test_groupby(self):
+        """Test grouping a DataFrame by a hwaddress column."""
+        macs = ["22-34-56-78-90-ab", "12-34-56-78-90-ab", "22-34-56-78-90-ab", "02-34-56-78-90-ab"]
+        df = pd.DataFrame({"mac": pd.Series(macs, dtype="hwaddress[EUI_48]"), "port": [1, 2, 3, 4]})
+
+        result = df.groupby("mac")["port"].sum()
+        self.assertEqual(result.index.dtype, HWAddressDtype(EUI_48))
+        self.assertEqual(list(result.index), [EUI_48(m) for m in sorted(set(macs))])
+        self.assertEqual(result.tolist(), [4, 2, 4])
+
+        result = df.groupby("mac", sort=False)["port"].sum()
+        self.assertEqual(list(result.index), [EUI_48(m) for m in macs[:2] + macs[3:]])
+        self.assertEqual(result.tolist(), [4, 2, 4])
+
+    def test_isin_searchsorted(self):
+        """Test membership and sorted insertion points."""
+        ser = pd.Series(["22-34-56-78-90-ab", "12-34-56-78-90-ab", None], dtype="hwaddress[EUI_48]")
+
+        self.assertEqual(ser.isin(["12-34-56-78-90-ab", "junk", 1 << 48]).tolist(), [0, 1, 0])
+        self.assertEqual(ser.isin([EUI_48("22-34-56-78-90-ab"), None]).tolist(), [1, 0, 1])
+        self.assertEqual(
+            (ser == "12-34-56-78-90-ab").tolist(), ser.isin(["12-34-56-78-90-ab"]).tolist()
+        )
+
+        ser = ser.dropna().sort_values()
+        self.assertEqual(ser.searchsorted(EUI_48("13-00-00-00-00-00")), 1)
+        self.assertEqual(ser.searchsorted("22-34-56-78-90-ab", side="right"), 2)
+        self.assertEqual(ser.searchsorted(["00-00-00-00-00-01", 1 << 47]).tolist(), [0, 2])
+
+        gids = [
+            "1234:5678:90ab:cdef:2234:5678:90ab:cdef",
+            "0234:5678:90ab:cdef:2234:5678:90ab:cdef",
+        ]
+        gids = pd.Series(gids, dtype="hwaddress[IB_GID]")
+        self.assertEqual(gids.isin([gids[1]]).tolist(), [False, True])
+        self.assertEqual(gids.sort_values().searchsorted(gids[0]), 1)
+
+    def test_ints_and_reductions(self):
+        """Test creating Series from ints and min/max."""
+        ser = pd.Series([2, None, 1], dtype="hwaddress[EUI_48]")
+
+        self.assertEqual(ser[2], EUI_48("00-00-00-00-00-01"))
+        self.assertEqual(pd.Series([np.uint64(3)], dtype="hwaddress[EUI_48]")[0].int, 3)
+        self.assertRaises(ValueError, pd.Series, [1 << 48], dtype="hwaddress[EUI_48]")
+        self.assertRaises(TypeError, pd.Series, [True], dtype="hwaddress[EUI_48]")
+
+        self.assertEqual(ser.min(), EUI_48("00-00-00-00-00-01"))
+        self.assertEqual(ser.max(), EUI_48("00-00-00-00-00-02"))
+        self.assertIs(ser.min(skipna=False), pd.NA)
+        self.assertIs(ser[1:2].max(), pd.NA)
+        self.assertEqual(pd.DataFrame({"mac": ser}).max()["mac"], EUI_48("00-00-00-00-00-02"))
+        self.assertRaises(TypeError, ser.sum)
+
+    def test_fillna(self):
+        """Test filling missing values with strings and hwaddress objects."""
+        ser = pd.Series(["12-34-56-78-90-ab", None], dtype="hwaddress[EUI_48]")
+
+        self.assertEqual(ser.fillna("22-34-56-78-90-ab")[1], EUI_48("22-34-56-78-90-ab"))
+        self.assertEqual(ser.ffill()[1], EUI_48("12-34-56-78-90-ab"))
+        self.assertEqual(ser.hw.fillna(MAC("22:34:56:78:90:ab"))[1], EUI_48("22-34-56-78-90-ab"))
+        self.assertEqual(ser.hw.fillna("22-34-56-78-90-ab").tolist()[0], ser[0])
+        self.assertTrue(ser.hw.fillna(None).isna()[1])
+        self.assertTrue(ser.isna()[1])
+
+    def test_verify_strings(self):
+        """Test verify on Series of strings."""
+        ser = pd.Series(["12-34-56-78-90-ab", "12:34:56:78:90:ab"])
+
+        self.assertEqual(list(ser.hw.verify(EUI_48)), [True, False])
+        self.assertRaises(TypeError, ser.hw.verify)
+
+    def test_wide_and_wwn(self):
+        """Test 128 bit addresses and WWN oui."""
+        gids = [
+            "1234:5678:90ab:cdef:2234:5678:90ab:cdef",
+            "0234:5678:90ab:cdef:2234:5678:90ab:cdef",
+        ]
+        ser = pd.Series(gids, dtype=HWAddressDtype(IB_GID))
+
+        self.assertEqual(list(ser.sort_values().hw.format()), gids[::-1])
+
+        wwns = ["12:34:56:78:90:ab:cd:ef", "52:34:56:78:90:ab:cd:ef"]
+        wwns = pd.Series(wwns, dtype="hwaddress[WWN]")
+        self.assertEqual([str(o) for o in wwns.hw.oui], ["56:78:90", "23:45:67"])
+
+        wwnx = ["62:34:56:78:90:ab:cd:ef:62:34:56:78:90:ab:cd:ef"]
+        wwnx = pd.Series(wwnx, dtype="hwaddress[WWNx]")
+        self.assertEqual(str(wwnx.hw.oui[0]), str(WWNx(wwnx[0].hex).oui))
+
+        wwns = pd.Series(["12:34:56:78:90:ab:cd:ef"] * 2, dtype="hwaddress[WWN]")
+        wwns.array._data[1, 0] = 0x3234567890ABCDEF
+        self.assertTrue(wwns.hw.oui.isna()[1])
+
+    def test_arrow_roundtrip(self):
+        """Test that class metadata survives arrow round-trips."""
+        T1MAC = new_hwaddress_class("T1MAC", 48, ".", 4, False)
+
+        gid = "1234:5678:90ab:cdef:2234:5678:90ab:cdef"
+        df = pd.DataFrame(
+            {
+                "wwn": pd.Series(["12:34:56:78:90:ab:cd:ef", None], dtype=HWAddressDtype(WWN)),
+                "gid": pd.Series([gid, None], dtype="hwaddress[IB_GID]"),
+                "t1": pd.Series(["1234.5678.90ab", "abcd.ef12.3456"], dtype=HWAddressDtype(T1MAC)),
+            }
+        )
+
+        result = pa.Table.from_pandas(df).to_pandas()
+
+        self.assertIs(result["wwn"].dtype.hwclass, WWN)
+        self.assertIs(result["gid"].dtype.hwclass, IB_GID)
+        self.assertEqual(result["t1"].dtype, HWAddressDtype(T1MAC))
+        self.assertTrue(pickle.loads(pickle.dumps(df)).equals(df))
+        self.assertEqual(list(result["t1"].hw.format()), ["1234.5678.90ab", "abcd.ef12.3456"])
+        self.assertTrue(result["wwn"].isna()[1])
+        self.assertTrue(result["gid"].isna()[1])
+
+        table = pa.table({"wwn": pa.chunked_array([], type=HWAddressArrowType(WWN))})
+        self.assertEqual(len(table.to_pandas()["wwn"]), 0)
+
+        t2 = HWAddressArrowType(new_hwaddress_class("T2MAC", 64, " ", (4, 2, 2, 4, 4), False))
+        t2 = pa.ipc.read_schema(pa.py_buffer(pa.schema([("t2", t2)]).serialize()))
+        self.assertEqual(t2.field("t2").type.hwclass._grp_, (4, 2, 2, 4, 4))
+
+        attrs = b'{"name": "WWN", "length": 48, "grouping": 2, "delimiter": ":", "upper": false, '
+        attrs += b'"module": "hwaddress.core", "qualname": "WWN"}'
+        t3 = HWAddressArrowType.__arrow_ext_deserialize__(pa.uint64(), attrs)
+        self.assertIsNot(t3.hwclass, WWN)
+        self.assertEqual(t3.hwclass._len_, 48)
+
+
+@unittest.skipIf(pd is None, "pandas extra is not installed")
+class HWAddressArrayOps(unittest.TestCase):
+    """Test HWAddressArray methods."""
+
+    def setUp(self):
+        """Create array of IB_LID addresses."""
+        self.dtype = HWAddressDtype(IB_LID)
+        self.arr = HWAddressArray._from_sequence(["0x0001", "0x0002", None], dtype=self.dtype)
+
+    def test_from_sequence(self):
+        """Test creating arrays."""
+        arr = self.arr
+
+        self.assertIs(HWAddressArray._from_sequence(arr, dtype=self.dtype), arr)
+        self.assertIs(HWAddressArray._from_sequence(arr, dtype="hwaddress[IB_LID]"), arr)
+        self.assertIsNot(HWAddressArray._from_sequence(arr, dtype=self.dtype, copy=True), arr)
+        self.assertEqual(
+            HWAddressArray._from_sequence(["12:34:56:78:90:ab"]).dtype, "hwaddress[MAC]"
+        )
+        self.assertEqual(
+            HWAddressArray._from_sequence([EUI_48("12-34-56-78-90-ab")])[0].int, 0x1234567890AB
+        )
+        self.assertEqual(
+            HWAddressArray._from_sequence_of_strings(["0x0003"], dtype=self.dtype)[0],
+            IB_LID("0x0003"),
+        )
+        self.assertRaises(ValueError, HWAddressArray._from_ints_, [1 << 16], self.dtype)
+        self.assertEqual(
+            HWAddressArray._from_factorized([1, None], arr).isna().tolist(), [False, True]
+        )
+
+    def test_getitem_setitem(self):
+        """Test indexing and assignment."""
+        arr = self.arr.copy()
+
+        self.assertIs(arr[2], pd.NA)
+        self.assertEqual(len(arr[[True, False, True]]), 2)
+        self.assertGreater(arr.nbytes, 0)
+
+        arr[0] = "0x00ff"
+        arr[[1, 2]] = ["0x0010", None]
+        arr[np.array([False, True, False])] = IB_LID("0x0020")
+        arr[2:] = "0x0030"
+
+        self.assertEqual([str(a) for a in arr], ["0x00ff", "0x0020", "0x0030"])
+
+    def test_eq(self):
+        """Test elementwise equity."""
+        arr = self.arr
+
+        self.assertEqual((arr == "0x0001").tolist(), [True, False, False])
+        self.assertEqual((arr == ["0x0001", "0x0003", None]).tolist(), [True, False, False])
+        self.assertEqual((arr == arr).tolist(), [True, True, False])
+        self.assertFalse((arr == HWAddressArray._from_sequence(["0x000000000001"] * 3)).any())
+        self.assertIs(arr.__eq__(pd.Series(arr)), NotImplemented)
+
+    def test_take(self):
+        """Test take with and without fill."""
+        arr = self.arr
+        empty = HWAddressArray._empty_(self.dtype)
+
+        self.assertEqual([str(a) for a in arr.take([1, 0])], ["0x0002", "0x0001"])
+        self.assertTrue(arr.take([0, -1], allow_fill=True).isna()[1])
+        self.assertTrue(empty.take([-1], allow_fill=True).isna().all())
+        self.assertRaises(ValueError, arr.take, [0], allow_fill=True, fill_value="0x0001")
+        self.assertRaises(ValueError, arr.take, [-2], allow_fill=True)
+        self.assertRaises(IndexError, empty.take, [0], allow_fill=True)
+        self.assertEqual(pd.Series(arr).astype(str).tolist()[:2], ["0x0001", "0x0002"])
+        self.assertIn("0x0001", repr(arr))
+        self.assertEqual(np.asarray(arr, dtype="U6").tolist(), ["0x0001", "0x0002", "<NA>"])
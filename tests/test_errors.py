@@ -19,6 +19,7 @@ class RaiseError(unittest.TestCase):
             ("_", 48, 3, 2, False),
             ("_", 48, ".", "2", False),
             ("_", 48, ".", 2, "Potato"),
+            ("_", 48, ".", [2], False),
         ]
 
         for model in modellist:
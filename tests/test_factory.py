@@ -17,6 +17,7 @@ from hwaddress import (
     IB_LID,
     IB_GUID,
     IB_GID,
+    OUI,
 )
 
 
@@ -198,3 +199,76 @@ class NewClassFactory(unittest.TestCase):
 
             for fs in model["flist"]:
                 self.assertFalse(HwCls.verify(fs))
+
+
+class GeneratorFactory(unittest.TestCase):
+    """Test random and sequence address generators."""
+
+    def test_random(self):
+        """Test random address generation."""
+        macs = MAC.random(1000, seed=1)
+
+        self.assertEqual(len(set(macs)), 1000)
+        self.assertEqual(macs, MAC.random(1000, seed=1))
+        self.assertNotEqual(macs, MAC.random(1000, seed=2))
+
+        local = EUI_48.random(100, oui="02:00:00", locally_administered=True, unicast=True)
+        for eui in local:
+            self.assertIsInstance(eui, EUI_48)
+            self.assertEqual(str(eui.oui), "02:00:00")
+
+        for mac in MAC.random(100, locally_administered=False, unicast=False):
+            self.assertEqual(int(mac[1], 16) & 0x3, 0x1)
+
+        for wwn in WWN.random(100) + WWNx.random(100):
+            self.assertIn(wwn.naa, wwn._lead_)
+
+        lids = IB_LID.random(10, seed=1)
+        self.assertEqual(set(IB_LID.random(60000, exclude=set(lids))) & set(lids), set())
+
+        self.assertRaises(ValueError, IB_LID.random, 65537)
+        self.assertRaises(ValueError, IB_LID.random, 10, exclude=set(IB_LID.sequence(0, 65536)))
+        self.assertRaises(TypeError, WWN.random, 1, oui="12:34:56")
+
+        for oui in (0x020000, OUI("02:00:00"), "02:00:00"):
+            self.assertEqual(str(EUI_48.random(1, oui=oui)[0].oui), "02:00:00")
+
+        self.assertRaises(ValueError, EUI_48.random, 1, oui=1 << 24)
+        self.assertRaises(TypeError, IB_LID.random, 1, oui="02:00:00")
+        self.assertRaises(TypeError, WWN.random, 1, locally_administered=True)
+        self.assertRaises(TypeError, WWNx.random, 1, unicast=False)
+        self.assertRaises(ValueError, EUI_48.random, 1, oui="00:25:96", locally_administered=True)
+        self.assertRaises(ValueError, EUI_48.random, 1, oui="01:25:96", unicast=True)
+
+        for eui in EUI_48.random(10, oui="03:25:96", locally_administered=True, unicast=False):
+            self.assertEqual(str(eui.oui), "03:25:96")
+        self.assertRaises(TypeError, EUI_48.random, 1, oui=EUI_48("02-00-00-00-00-00"))
+        self.assertRaises(TypeError, EUI_48.random, 1, oui=True)
+
+        euis = EUI_48.random(100, seed=3)
+        exclude = [MAC(str(euis[0]).replace("-", ":")), str(euis[1]), euis[2].int] + euis[3:]
+        self.assertEqual(set(EUI_48.random(100, seed=3, exclude=exclude)) & set(euis), set())
+
+        self.assertRaises(TypeError, EUI_48.random, 1, exclude=[EUI_64("02-00-00-00-00-00-00-00")])
+        self.assertRaises(ValueError, EUI_48.random, 1, exclude=[1 << 48])
+
+    def test_sequence(self):
+        """Test sequential address generation."""
+        macs = MAC.sequence("12:34:56:78:90:fe", 3, exclude={MAC("12:34:56:78:90:ff")})
+
+        self.assertEqual(
+            [str(m) for m in macs], ["12:34:56:78:90:fe", "12:34:56:78:91:00", "12:34:56:78:91:01"]
+        )
+        self.assertEqual(
+            IB_LID.sequence(IB_LID("0x0010"), 2, step=-16), [IB_LID("0x0010"), IB_LID("0x0000")]
+        )
+
+        self.assertEqual(IB_LID.sequence(0, 2, exclude=["0x0000", 1]), IB_LID.sequence(2, 2))
+
+        self.assertRaises(ValueError, IB_LID.sequence, 0xFFFF, 2)
+        self.assertRaises(ValueError, IB_LID.sequence, 0, 2, step=0)
+        self.assertEqual(
+            EUI_48.sequence(MAC("00:00:00:00:00:01"), 2), EUI_48.sequence("00-00-00-00-00-01", 2)
+        )
+        self.assertRaises(TypeError, EUI_48.sequence, EUI_64("00-00-00-00-00-00-00-01"), 2)
+        self.assertRaises(ValueError, WWN.sequence, 0x2FFFFFFFFFFFFFFF, 2)
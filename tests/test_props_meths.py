@@ -1,7 +1,9 @@
 """unittests for properties and methods."""
 
+import pickle
 import unittest
-from hwaddress import MAC, GUID, EUI_48, WWN, IB_GUID, IB_GID
+from hwaddress import MAC, GUID, EUI_48, EUI_64, WWN, WWNx, IB_GUID, IB_GID, new_hwaddress_class
+from hwaddress import core
 
 
 class MACProps(unittest.TestCase):
@@ -15,6 +17,8 @@ class MACProps(unittest.TestCase):
         self.assertEqual(str(mac), "12:34:56:78:90:ab")
         self.assertEqual(mac.int, 20015998341291)
         self.assertEqual(mac.hex, "0x1234567890ab")
+        self.assertEqual(len(mac), 12)
+        self.assertEqual(list(mac)[:2], ["1", "2"])
         self.assertEqual(
             mac.binary, "0001 0010 0011 0100 0101 0110 " + "0111 1000 1001 0000 1010 1011"
         )
@@ -56,6 +60,40 @@ class EUIProps(unittest.TestCase):
         self.assertEqual(str(eui.cid), "12:34:56")
         self.assertEqual(str(eui.oui36), "12:34:56:78:9")
 
+    def test_eui_conversions(self):
+        """Test EUI-48/EUI-64 conversions."""
+        eui48 = EUI_48("00-25-96-12-34-56")
+        eui64 = EUI_64("00-25-96-ff-fe-12-34-56")
+        modified = EUI_64("02-25-96-ff-fe-12-34-56")
+        iid = bytes.fromhex("022596fffe123456")
+
+        self.assertEqual(eui48.to_eui64(), eui64)
+        self.assertEqual(eui48.to_eui64(modified=True), modified)
+        self.assertEqual(eui64.to_eui48(), eui48)
+        self.assertEqual(modified.to_eui48(modified=True), eui48)
+        self.assertEqual(eui48.interface_id(), iid)
+        self.assertEqual(eui64.interface_id(), iid)
+        self.assertEqual(IB_GUID("0025:96ff:fe12:3456").to_eui48(), eui48)
+
+        self.assertEqual(EUI_48.to_eui64_batch([eui48, eui48.int]), [eui64, eui64])
+        self.assertEqual(EUI_48.interface_id_batch([eui48]), [iid])
+        self.assertEqual(EUI_64.to_eui48_batch([modified], modified=True), [eui48])
+        self.assertEqual(EUI_64.interface_id_batch([eui64.int]), [iid])
+
+        self.assertRaises(ValueError, EUI_64("00-25-96-12-34-56-78-90").to_eui48)
+
+        self.assertRaises(TypeError, EUI_48.to_eui64_batch, [MAC("00:25:96:12:34:56")])
+        self.assertRaises(TypeError, EUI_48.interface_id_batch, ["00-25-96-12-34-56"])
+        self.assertRaises(TypeError, EUI_64.to_eui48_batch, [eui48])
+        self.assertRaises(TypeError, EUI_64.interface_id_batch, [True])
+        self.assertRaises(ValueError, EUI_48.to_eui64_batch, [1 << 48])
+        self.assertRaises(ValueError, EUI_48.interface_id_batch, [-1])
+        self.assertRaises(ValueError, EUI_64.interface_id_batch, [1 << 64])
+
+        self.assertRaises(ValueError, EUI_48._from_int_, 1 << 48)
+        self.assertRaises(ValueError, EUI_48._from_int_, -1)
+        self.assertRaises(ValueError, EUI_48._from_ints_, [0, 1 << 48])
+
 
 class WWNProps(unittest.TestCase):
     """Test WWN properties."""
@@ -70,6 +108,11 @@ class WWNProps(unittest.TestCase):
 
         self.assertEqual(str(wwn1.oui), "56:78:90")
         self.assertEqual(str(wwn5.oui), "23:45:67")
+        self.assertIs(type(wwn1.oui), core.OUI)
+
+        wwnx = WWNx("62:34:56:78:90:ab:cd:ef:62:34:56:78:90:ab:cd:ef")
+        self.assertEqual(str(wwnx.oui), "23:45:67")
+        self.assertEqual(str(WWN("22:34:56:78:90:ab:cd:ef").oui), "56:78:90")
 
 
 class IBGIDProps(unittest.TestCase):
@@ -82,3 +125,85 @@ class IBGIDProps(unittest.TestCase):
 
         self.assertEqual(str(ibgid.prefix), "1234:5678:90ab:cdef")
         self.assertEqual(ibgid.guid, ibguid)
+
+
+class UserMAC(MAC):
+    """Importable user subclass with its own method."""
+
+    _del_ = "."
+    _grp_ = 4
+
+    def vendor(self):
+        return "user"
+
+
+class OUI(MAC):
+    """User class sharing the name and format of the internal OUI class."""
+
+    _len_ = 24
+
+    def _restrict_(self):
+        raise ValueError("user OUI")
+
+
+class Pickling(unittest.TestCase):
+    """Test class registry and pickling."""
+
+    def test_pickle(self):
+        """Test that instances of built-in and dynamic classes round-trip."""
+        T1MAC = new_hwaddress_class("T1MAC", 48, ".", 4, False)
+        eui = EUI_48("12-34-56-78-90-ab")
+
+        self.assertIs(new_hwaddress_class("T1MAC", 48, ".", 4, False), T1MAC)
+        self.assertIs(eui.oui.__class__, EUI_48("22-34-56-78-90-ab").oui.__class__)
+
+        for obj in (eui, WWN("52:34:56:78:90:ab:cd:ef"), T1MAC("1234.5678.90ab"), eui.oui):
+            result = pickle.loads(pickle.dumps(obj))
+            self.assertIs(type(result), type(obj))
+            self.assertEqual(result, obj)
+
+    def test_pickle_user_class(self):
+        """Test that importable user classes pickle by reference."""
+        result = pickle.loads(pickle.dumps(UserMAC("1234.5678.90ab")))
+
+        self.assertIs(type(result), UserMAC)
+        self.assertEqual(result.vendor(), "user")
+        self.assertIs(core._class_ref_(UserMAC), UserMAC)
+        self.assertNotIn(core._class_key_(UserMAC), core._registry_)
+
+    def test_pickle_local_class(self):
+        """Test that classes that can not be imported are not pickled by key."""
+
+        class Local(EUI_48):
+            pass
+
+        T4MAC = new_hwaddress_class("T4MAC", 48, ".", 4, False)
+
+        class LocalT4(T4MAC):
+            pass
+
+        for obj in (Local("12-34-56-78-90-ab"), LocalT4("1234.5678.90ab")):
+            self.assertRaises(pickle.PicklingError, pickle.dumps, obj)
+
+        self.assertIs(type(pickle.loads(pickle.dumps(T4MAC("1234.5678.90ab")))), T4MAC)
+
+    def test_user_class_name(self):
+        """Test that a user class named OUI is not used by the oui property."""
+        oui = EUI_48("12-34-56-78-90-ab").oui
+
+        self.assertIs(type(oui), core.OUI)
+        self.assertEqual(str(oui), "12:34:56")
+        self.assertIs(type(pickle.loads(pickle.dumps(oui))), core.OUI)
+        self.assertRaises(ValueError, OUI, "12:34:56")
+
+    def test_unpickle_unknown_class(self):
+        """Test that a class missing from the registry is recreated from its key."""
+        T3MAC = new_hwaddress_class("T3MAC", 64, " ", (4, 2, 2, 4, 4), True)
+        data = pickle.dumps(T3MAC("1234 56 78 90ab cdef"))
+
+        del core._registry_[core._class_key_(T3MAC)]
+        result = pickle.loads(data)
+
+        self.assertIsNot(type(result), T3MAC)
+        self.assertEqual(str(result), "1234 56 78 90AB CDEF")
+        self.assertIs(core._registry_[core._class_key_(T3MAC)], type(result))